@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de serialización de respuestas JSON del servidor.
+
+Compara, para el payload de /status y para un payload de error:
+- jsonify con el proveedor JSON por defecto de Flask (modo debug, como corre el servidor)
+- respuesta pre-serializada con json_constante (sin volver a serializar)
+- jsonify con RapidoJSONProvider (orjson si está instalado)
+
+Uso:
+    python benchmark_json.py [iteraciones]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from flask.json.provider import DefaultJSONProvider
+
+import servidor
+
+
+PAYLOAD_STATUS = {
+    'status': 'ok',
+    'message': 'Servidor funcionando correctamente',
+    'version': '1.1',
+    'autenticacion': 'basic',
+    'endpoints': {
+        'POST /registro': 'Registrar nuevo usuario',
+        'POST /login': 'Validar credenciales',
+        'GET /tareas': 'Página de tareas (basic auth)',
+        'GET /eventos': 'Auditoría de autenticación (basic auth)',
+        'POST /logout': 'Mensaje informativo',
+        'GET /status': 'Estado del servidor'
+    }
+}
+PAYLOAD_ERROR = {'error': 'Endpoint no encontrado'}
+
+
+def medir(nombre: str, funcion, iteraciones: int) -> tuple:
+    for _ in range(min(iteraciones, 1000)):
+        funcion()
+
+    inicio = time.perf_counter()
+    for _ in range(iteraciones):
+        funcion()
+    microsegundos = (time.perf_counter() - inicio) / iteraciones * 1e6
+
+    # Memoria medida aparte para no distorsionar el tiempo de CPU: pico de
+    # bytes asignados durante cada respuesta, promediado entre muestras
+    muestras = min(iteraciones, 2000)
+    picos = 0
+    tracemalloc.start()
+    for _ in range(muestras):
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        funcion()
+        picos += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    bytes_por_respuesta = picos / muestras
+
+    servidor.log_bullet(f"{nombre:<34} {microsegundos:8.2f} µs/resp   {bytes_por_respuesta:8.0f} B/resp")
+    return microsegundos, bytes_por_respuesta
+
+
+def main() -> None:
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = servidor.app
+    app.debug = True
+    flask_por_defecto = DefaultJSONProvider(app)
+    rapido = servidor.RapidoJSONProvider(app)
+
+    servidor.log_title(f"Benchmark de respuestas JSON ({iteraciones} iteraciones)")
+    servidor.log_info(f"Codificador rápido: {'orjson' if servidor.orjson else 'json (stdlib, compacto)'}")
+
+    casos = [
+        ('/status', PAYLOAD_STATUS, servidor.RESPUESTA_STATUS),
+        ('error 404', PAYLOAD_ERROR, servidor.RESPUESTA_NO_ENCONTRADO),
+    ]
+    with app.test_request_context():
+        for etiqueta, payload, constante in casos:
+            servidor.log_info(f"Payload {etiqueta}")
+            base, base_mem = medir(
+                'jsonify (Flask por defecto)',
+                lambda: app.make_response(flask_por_defecto.response(payload)), iteraciones
+            )
+            pre, pre_mem = medir(
+                'pre-serializada (json_constante)',
+                lambda: app.make_response(constante()), iteraciones
+            )
+            dinamico, dinamico_mem = medir(
+                'jsonify (RapidoJSONProvider)',
+                lambda: app.make_response(rapido.response(payload)), iteraciones
+            )
+            servidor.log_ok(
+                f"Ahorro de CPU: pre-serializada {100 * (1 - pre / base):.0f}%, "
+                f"proveedor rápido {100 * (1 - dinamico / base):.0f}%"
+            )
+            servidor.log_ok(
+                f"Pre-serializada frente al proveedor rápido: {100 * (1 - pre / dinamico):.0f}% menos CPU, "
+                f"{100 * (1 - pre_mem / dinamico_mem):.0f}% menos memoria"
+            )
+            servidor.log_ok(
+                f"Ahorro de memoria: pre-serializada {100 * (1 - pre_mem / base_mem):.0f}%, "
+                f"proveedor rápido {100 * (1 - dinamico_mem / base_mem):.0f}%"
+            )
+            servidor.log_bullet(
+                f"Tamaño: {len(flask_por_defecto.response(payload).get_data())} B -> {len(constante.args[0])} B"
+            )
+
+
+if __name__ == '__main__':
+    main()
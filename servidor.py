@@ -1,15 +1,163 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, has_request_context
+from flask.json.provider import DefaultJSONProvider
+import argparse
+import atexit
+import collections
+import functools
+import gzip
+import json
+import os
+import shutil
 import sqlite3
+import threading
+import time
 import bcrypt
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
 
 app = Flask(__name__)
 DATABASE = 'tareas.db'
 
+# Intervalos (en segundos) de las tareas de mantenimiento de SQLite
+MANTENIMIENTO_INTERVALOS = {
+    'wal_checkpoint': int(os.environ.get('MANT_INTERVALO_CHECKPOINT', 300)),
+    'incremental_vacuum': int(os.environ.get('MANT_INTERVALO_VACUUM', 1800)),
+    'optimize': int(os.environ.get('MANT_INTERVALO_OPTIMIZE', 3600)),
+    'analyze': int(os.environ.get('MANT_INTERVALO_ANALYZE', 86400)),
+}
+# Segundos sin peticiones para considerar que el servidor está en baja carga
+MANTENIMIENTO_INACTIVIDAD = int(os.environ.get('MANT_INACTIVIDAD', 5))
+# Páginas liberadas por transacción de incremental_vacuum
+MANTENIMIENTO_PAGINAS_VACUUM = 64
+# Tiempo máximo (ms) que el mantenimiento espera un lock antes de desistir
+MANTENIMIENTO_BUSY_TIMEOUT_MS = 50
+# Filas muestreadas por índice en ANALYZE, para acotar el tiempo con el lock tomado
+MANTENIMIENTO_ANALYSIS_LIMIT = 1000
+
+# Respaldos en caliente de la base de datos
+BACKUP_DIRECTORIO = os.environ.get('BACKUP_DIRECTORIO', 'backups')
+BACKUP_CONSERVAR = int(os.environ.get('BACKUP_CONSERVAR', 7))
+
+# Registro de auditoría de eventos de autenticación
+AUDITORIA_CAPACIDAD = int(os.environ.get('AUDITORIA_CAPACIDAD', 10000))
+AUDITORIA_LOTE = int(os.environ.get('AUDITORIA_LOTE', 200))
+AUDITORIA_INTERVALO_FLUSH = float(os.environ.get('AUDITORIA_INTERVALO_FLUSH', 1.0))
+AUDITORIA_ADMINS = {
+    nombre.strip() for nombre in os.environ.get('AUDITORIA_ADMINS', '').split(',') if nombre.strip()
+}
+AUDITORIA_LIMITE_CONSULTA = 1000
+# Formato de fecha de los eventos (igual que CURRENT_TIMESTAMP de SQLite, en UTC)
+FORMATO_FECHA = '%Y-%m-%d %H:%M:%S'
+
+
+# =============================================================================
+# SERIALIZACIÓN JSON
+# =============================================================================
+
+# Claves ordenadas, como el proveedor por defecto de Flask
+_json_encoder = json.JSONEncoder(
+    ensure_ascii=False, separators=(',', ':'), sort_keys=True, default=DefaultJSONProvider.default
+)
+
+
+_ORJSON_OPCIONES = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+    if orjson is not None else 0
+)
+
+
+def serializar_json(obj) -> bytes:
+    """Serializa a JSON compacto en UTF-8, usando orjson si está instalado"""
+    if orjson is not None:
+        # Las opciones PASSTHROUGH delegan fechas y dataclasses en el mismo `default`
+        # que usa Flask. Los floats no finitos siguen saliendo como null con orjson
+        try:
+            return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_ORJSON_OPCIONES)
+        except TypeError:
+            # Enteros de más de 64 bits y otros tipos que orjson rechaza
+            pass
+    return _json_encoder.encode(obj).encode('utf-8')
+
+
+class RapidoJSONProvider(DefaultJSONProvider):
+    """Proveedor JSON de Flask que siempre genera salida compacta con `serializar_json`"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return serializar_json(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(serializar_json(obj), mimetype=self.mimetype)
+
+
+app.json = RapidoJSONProvider(app)
+
+def json_constante(payload: dict, status: int = 200, headers: dict = None) -> functools.partial:
+    """Pre-serializa una respuesta que no cambia entre peticiones.
+
+    Devuelve una fábrica que crea la `Response` directamente a partir de los bytes
+    ya serializados; cada petición recibe su propio objeto.
+    """
+    return functools.partial(
+        app.response_class, serializar_json(payload), status=status,
+        mimetype='application/json', headers=headers
+    )
+
+
+RESPUESTA_NO_AUTORIZADO = json_constante(
+    {'error': 'Credenciales inválidas o ausentes'}, 401,
+    {'WWW-Authenticate': 'Basic realm="Sistema de Tareas"'}
+)
+RESPUESTA_USUARIO_CORTO = json_constante(
+    {'error': 'El nombre de usuario debe tener al menos 3 caracteres'}, 400
+)
+RESPUESTA_CONTRASEÑA_CORTA = json_constante({'error': 'La contraseña debe tener al menos 4 caracteres'}, 400)
+RESPUESTA_USUARIO_EXISTENTE = json_constante({'error': 'El usuario ya existe'}, 400)
+RESPUESTA_CREDENCIALES_INVALIDAS = json_constante({'error': 'Credenciales inválidas'}, 401)
+RESPUESTA_HTML_NO_ENCONTRADO = json_constante({'error': 'Archivo HTML no encontrado'}, 500)
+RESPUESTA_EVENTOS_PROHIBIDO = json_constante(
+    {'error': 'No autorizado para consultar eventos de otros usuarios'}, 403
+)
+RESPUESTA_FECHA_INVALIDA = json_constante(
+    {'error': "Los parámetros desde/hasta deben tener el formato 'AAAA-MM-DD HH:MM:SS'"}, 400
+)
+RESPUESTA_LIMITE_INVALIDO = json_constante({'error': 'El parámetro limite debe ser un entero positivo'}, 400)
+RESPUESTA_LOGOUT = json_constante({
+    'mensaje': 'Autenticación básica: no hay sesión que cerrar. Cierra el cliente o limpia las credenciales.'
+})
+RESPUESTA_STATUS = json_constante({
+    'status': 'ok',
+    'message': 'Servidor funcionando correctamente',
+    'version': '1.1',
+    'autenticacion': 'basic',
+    'endpoints': {
+        'POST /registro': 'Registrar nuevo usuario',
+        'POST /login': 'Validar credenciales',
+        'GET /tareas': 'Página de tareas (basic auth)',
+        'GET /eventos': 'Auditoría de autenticación (basic auth)',
+        'POST /logout': 'Mensaje informativo',
+        'GET /status': 'Estado del servidor'
+    }
+})
+RESPUESTA_NO_ENCONTRADO = json_constante({'error': 'Endpoint no encontrado'}, 404)
+RESPUESTA_METODO_NO_PERMITIDO = json_constante({'error': 'Método no permitido para este endpoint'}, 405)
+RESPUESTA_ERROR_INTERNO = json_constante({'error': 'Error interno del servidor'}, 500)
+
 
 def init_db() -> None:
     """Inicializa la base de datos con la tabla de usuarios"""
     conn = sqlite3.connect(DATABASE)
+    # auto_vacuum solo tiene efecto en bases nuevas (o tras un VACUUM completo)
+    conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+    # WAL permite que lectores y checkpoints no bloqueen a /registro
+    conn.execute('PRAGMA journal_mode = WAL')
     cursor = conn.cursor()
     cursor.execute(
         '''
@@ -21,6 +169,21 @@ def init_db() -> None:
         )
         '''
     )
+    cursor.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS eventos_auth (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fecha TIMESTAMP NOT NULL,
+            evento TEXT NOT NULL,
+            usuario TEXT,
+            ip TEXT,
+            exito INTEGER NOT NULL,
+            detalle TEXT
+        )
+        '''
+    )
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_eventos_auth_usuario_fecha ON eventos_auth (usuario, fecha)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_eventos_auth_fecha ON eventos_auth (fecha)')
     conn.commit()
     conn.close()
 
@@ -57,21 +220,26 @@ def fetch_user(username: str):
 def require_basic_auth():
     auth = request.authorization
     if not auth or not auth.username or not auth.password:
+        registrar_evento('basic_auth', auth.username if auth else None, False, 'Credenciales ausentes')
         return None
     user_row = fetch_user(auth.username)
     if not user_row:
+        registrar_evento('basic_auth', auth.username, False, 'Usuario inexistente')
         return None
     if not verify_password(auth.password, user_row['password_hash']):
+        registrar_evento('basic_auth', auth.username, False, 'Contraseña incorrecta')
         return None
     return user_row
 
 
+@app.before_request
+def registrar_actividad() -> None:
+    marcar_actividad()
+    iniciar_hilos_en_segundo_plano()
+
+
 def unauthorized_response():
-    return (
-        jsonify({'error': 'Credenciales inválidas o ausentes'}),
-        401,
-        {'WWW-Authenticate': 'Basic realm="Sistema de Tareas"'}
-    )
+    return RESPUESTA_NO_AUTORIZADO()
 
 
 @app.route('/registro', methods=['POST'])
@@ -82,26 +250,30 @@ def registro():
         contraseña = data.get('contraseña') or ''
 
         if len(usuario) < 3:
-            return jsonify({'error': 'El nombre de usuario debe tener al menos 3 caracteres'}), 400
+            registrar_evento('registro', usuario, False, 'Usuario demasiado corto')
+            return RESPUESTA_USUARIO_CORTO()
         if len(contraseña) < 4:
-            return jsonify({'error': 'La contraseña debe tener al menos 4 caracteres'}), 400
+            registrar_evento('registro', usuario, False, 'Contraseña demasiado corta')
+            return RESPUESTA_CONTRASEÑA_CORTA()
 
         conn = get_db_connection()
         cursor = conn.cursor()
         cursor.execute('SELECT id FROM usuarios WHERE usuario = ?', (usuario,))
         if cursor.fetchone():
             conn.close()
-            return jsonify({'error': 'El usuario ya existe'}), 400
+            registrar_evento('registro', usuario, False, 'Usuario existente')
+            return RESPUESTA_USUARIO_EXISTENTE()
 
         password_hash = hash_password(contraseña)
         cursor.execute('INSERT INTO usuarios (usuario, password_hash) VALUES (?, ?)', (usuario, password_hash))
         conn.commit()
         conn.close()
 
+        registrar_evento('registro', usuario, True)
         return jsonify({'mensaje': 'Usuario registrado exitosamente', 'usuario': usuario}), 201
     except Exception as exc:
         log_error(f"Error en /registro: {exc}")
-        return jsonify({'error': 'Error interno del servidor'}), 500
+        return RESPUESTA_ERROR_INTERNO()
 
 
 @app.route('/login', methods=['POST'])
@@ -113,8 +285,10 @@ def login():
 
         user_row = fetch_user(usuario)
         if not user_row or not verify_password(contraseña, user_row['password_hash']):
-            return jsonify({'error': 'Credenciales inválidas'}), 401
+            registrar_evento('login', usuario, False, 'Credenciales inválidas')
+            return RESPUESTA_CREDENCIALES_INVALIDAS()
 
+        registrar_evento('login', usuario, True)
         return jsonify({
             'mensaje': 'Credenciales válidas',
             'usuario': user_row['usuario'],
@@ -122,7 +296,7 @@ def login():
         }), 200
     except Exception as exc:
         log_error(f"Error en /login: {exc}")
-        return jsonify({'error': 'Error interno del servidor'}), 500
+        return RESPUESTA_ERROR_INTERNO()
 
 
 @app.route('/tareas', methods=['GET'])
@@ -138,46 +312,69 @@ def tareas():
             html_content = html_file.read().replace('{{ usuario }}', username)
         return html_content, 200, {'Content-Type': 'text/html; charset=utf-8'}
     except FileNotFoundError:
-        return jsonify({'error': 'Archivo HTML no encontrado'}), 500
+        return RESPUESTA_HTML_NO_ENCONTRADO()
 
 
-@app.route('/logout', methods=['POST', 'GET'])
-def logout():
+@app.route('/eventos', methods=['GET'])
+def eventos():
+    user_row = require_basic_auth()
+    if not user_row:
+        return unauthorized_response()
+
+    usuario = request.args.get('usuario')
+    # Solo los administradores de auditoría pueden consultar eventos de otros usuarios
+    if user_row['usuario'] not in AUDITORIA_ADMINS:
+        if usuario and usuario != user_row['usuario']:
+            return RESPUESTA_EVENTOS_PROHIBIDO()
+        usuario = user_row['usuario']
+
+    try:
+        limite = int(request.args.get('limite', 100))
+    except ValueError:
+        return RESPUESTA_LIMITE_INVALIDO()
+    # SQLite interpreta un LIMIT negativo como "sin límite"
+    if limite < 1:
+        return RESPUESTA_LIMITE_INVALIDO()
+    limite = min(limite, AUDITORIA_LIMITE_CONSULTA)
+
+    desde = request.args.get('desde')
+    hasta = request.args.get('hasta')
+    # Las fechas se comparan como texto: deben tener exactamente el formato almacenado
+    for fecha in (desde, hasta):
+        if fecha is not None and not fecha_valida(fecha):
+            return RESPUESTA_FECHA_INVALIDA()
+
+    filas = consultar_eventos(usuario, desde, hasta, limite)
     return jsonify({
-        'mensaje': 'Autenticación básica: no hay sesión que cerrar. Cierra el cliente o limpia las credenciales.'
+        'eventos': [dict(fila) for fila in filas],
+        'cantidad': len(filas),
+        'descartados': auditoria_descartados(),
     }), 200
 
 
+@app.route('/logout', methods=['POST', 'GET'])
+def logout():
+    return RESPUESTA_LOGOUT()
+
+
 @app.route('/status', methods=['GET'])
 def status():
-    return jsonify({
-        'status': 'ok',
-        'message': 'Servidor funcionando correctamente',
-        'version': '1.1',
-        'autenticacion': 'basic',
-        'endpoints': {
-            'POST /registro': 'Registrar nuevo usuario',
-            'POST /login': 'Validar credenciales',
-            'GET /tareas': 'Página de tareas (basic auth)',
-            'POST /logout': 'Mensaje informativo',
-            'GET /status': 'Estado del servidor'
-        }
-    })
+    return RESPUESTA_STATUS()
 
 
 @app.errorhandler(404)
 def not_found(error):  # pragma: no cover - rutas inválidas
-    return jsonify({'error': 'Endpoint no encontrado'}), 404
+    return RESPUESTA_NO_ENCONTRADO()
 
 
 @app.errorhandler(405)
 def method_not_allowed(error):  # pragma: no cover - métodos inválidos
-    return jsonify({'error': 'Método no permitido para este endpoint'}), 405
+    return RESPUESTA_METODO_NO_PERMITIDO()
 
 
 @app.errorhandler(500)
 def internal_error(error):  # pragma: no cover - errores generales
-    return jsonify({'error': 'Error interno del servidor'}), 500
+    return RESPUESTA_ERROR_INTERNO()
 
 
 # =============================================================================
@@ -218,11 +415,442 @@ def log_bullet(message: str) -> None:
     print(f"   {ConsoleColors.INFO}{message}{ConsoleColors.RESET}")
 
 
+# =============================================================================
+# MANTENIMIENTO DE LA BASE DE DATOS
+# =============================================================================
+
+_ultima_actividad = time.monotonic()
+_mantenimiento_detener = threading.Event()
+
+
+def marcar_actividad() -> None:
+    global _ultima_actividad
+    _ultima_actividad = time.monotonic()
+
+
+def servidor_inactivo() -> bool:
+    return time.monotonic() - _ultima_actividad >= MANTENIMIENTO_INACTIVIDAD
+
+
+def _contar_paginas(conn: sqlite3.Connection) -> tuple:
+    page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    freelist_count = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    return page_count, freelist_count
+
+
+def _tarea_wal_checkpoint(conn: sqlite3.Connection) -> None:
+    # PASSIVE nunca espera a lectores ni escritores
+    conn.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchone()
+
+
+def _tarea_incremental_vacuum(conn: sqlite3.Connection) -> None:
+    # En bases creadas antes de activar auto_vacuum = INCREMENTAL (2) el pragma no hace nada
+    if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+        log_warn("incremental_vacuum omitido: la base no usa auto_vacuum = INCREMENTAL (requiere un VACUUM completo)")
+        return
+    # Se liberan pocas páginas por transacción para no retener el lock de escritura
+    libres = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    while libres and not _mantenimiento_detener.is_set() and servidor_inactivo():
+        conn.execute(f'PRAGMA incremental_vacuum({MANTENIMIENTO_PAGINAS_VACUUM})').fetchall()
+        conn.commit()
+        libres_restantes = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        if libres_restantes >= libres:
+            break
+        libres = libres_restantes
+
+
+def _tarea_optimize(conn: sqlite3.Connection) -> None:
+    conn.execute('PRAGMA optimize')
+
+
+def _tarea_analyze(conn: sqlite3.Connection) -> None:
+    # Sin límite, ANALYZE recorre tablas enteras (eventos_auth solo crece)
+    conn.execute(f'PRAGMA analysis_limit = {MANTENIMIENTO_ANALYSIS_LIMIT}')
+    conn.execute('ANALYZE')
+    conn.commit()
+
+
+TAREAS_MANTENIMIENTO = {
+    'wal_checkpoint': _tarea_wal_checkpoint,
+    'incremental_vacuum': _tarea_incremental_vacuum,
+    'optimize': _tarea_optimize,
+    'analyze': _tarea_analyze,
+}
+
+
+def ejecutar_tarea_mantenimiento(nombre: str) -> bool:
+    """Ejecuta una tarea de mantenimiento y registra duración y páginas.
+
+    Devuelve False si la tarea debe reintentarse en la próxima ventana de baja carga.
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(DATABASE, timeout=MANTENIMIENTO_BUSY_TIMEOUT_MS / 1000)
+        conn.execute(f'PRAGMA busy_timeout = {MANTENIMIENTO_BUSY_TIMEOUT_MS}')
+        paginas_antes, libres_antes = _contar_paginas(conn)
+        inicio = time.perf_counter()
+        TAREAS_MANTENIMIENTO[nombre](conn)
+        duracion_ms = (time.perf_counter() - inicio) * 1000
+        paginas_despues, libres_despues = _contar_paginas(conn)
+        log_info(
+            f"Mantenimiento '{nombre}' en {duracion_ms:.1f} ms - "
+            f"páginas {paginas_antes} -> {paginas_despues}, "
+            f"libres {libres_antes} -> {libres_despues}"
+        )
+        return True
+    except sqlite3.OperationalError as exc:
+        mensaje = str(exc).lower()
+        if 'locked' in mensaje or 'busy' in mensaje:
+            # Base ocupada: se reintenta en la próxima ventana de baja carga
+            log_warn(f"Mantenimiento '{nombre}' pospuesto: {exc}")
+            return False
+        log_error(f"Mantenimiento '{nombre}' falló: {exc}")
+        return True
+    except sqlite3.Error as exc:
+        # Cualquier otro error no debe terminar el hilo; se reintenta en el próximo intervalo
+        log_error(f"Mantenimiento '{nombre}' falló: {exc}")
+        return True
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def _bucle_mantenimiento() -> None:
+    ultima_ejecucion = {nombre: time.monotonic() for nombre in TAREAS_MANTENIMIENTO}
+    while not _mantenimiento_detener.wait(1):
+        if not servidor_inactivo():
+            continue
+        for nombre, intervalo in MANTENIMIENTO_INTERVALOS.items():
+            if _mantenimiento_detener.is_set() or not servidor_inactivo():
+                break
+            if time.monotonic() - ultima_ejecucion[nombre] < intervalo:
+                continue
+            if ejecutar_tarea_mantenimiento(nombre):
+                ultima_ejecucion[nombre] = time.monotonic()
+
+
+def iniciar_mantenimiento() -> threading.Thread:
+    """Inicia el planificador de mantenimiento en un hilo en segundo plano"""
+    hilo = threading.Thread(target=_bucle_mantenimiento, name='mantenimiento-sqlite', daemon=True)
+    hilo.start()
+    atexit.register(detener_mantenimiento)
+    return hilo
+
+
+def detener_mantenimiento() -> None:
+    _mantenimiento_detener.set()
+
+
+_hilos_iniciados = False
+_hilos_lock = threading.Lock()
+
+
+def iniciar_hilos_en_segundo_plano() -> None:
+    """Arranca los hilos de mantenimiento y auditoría una única vez por proceso.
+
+    Se invoca con la primera petición, de modo que solo arrancan en el proceso que
+    atiende peticiones (hijo del reloader, `flask run` o un servidor WSGI).
+    """
+    global _hilos_iniciados
+    if _hilos_iniciados:
+        return
+    with _hilos_lock:
+        if _hilos_iniciados:
+            return
+        iniciar_mantenimiento()
+        iniciar_auditoria()
+        _hilos_iniciados = True
+    log_ok("Mantenimiento de SQLite y auditoría de autenticación activos")
+
+
+# =============================================================================
+# AUDITORÍA DE EVENTOS DE AUTENTICACIÓN
+# =============================================================================
+
+# Buffer circular: al llenarse, cada evento nuevo descarta el más antiguo
+_auditoria_buffer = collections.deque(maxlen=AUDITORIA_CAPACIDAD)
+_auditoria_lock = threading.Lock()
+_auditoria_pendiente = threading.Event()
+_auditoria_detener = threading.Event()
+_auditoria_descartados = 0
+
+
+def registrar_evento(evento: str, usuario, exito: bool, detalle: str = None) -> None:
+    """Encola un evento de autenticación; se persiste en lotes desde otro hilo"""
+    global _auditoria_descartados
+    fila = (
+        time.strftime(FORMATO_FECHA, time.gmtime()),
+        evento,
+        usuario,
+        request.remote_addr if has_request_context() else None,
+        int(exito),
+        detalle,
+    )
+    with _auditoria_lock:
+        if len(_auditoria_buffer) == _auditoria_buffer.maxlen:
+            _auditoria_descartados += 1
+        _auditoria_buffer.append(fila)
+        lote_completo = len(_auditoria_buffer) >= AUDITORIA_LOTE
+    if lote_completo:
+        _auditoria_pendiente.set()
+
+
+def auditoria_descartados() -> int:
+    return _auditoria_descartados
+
+
+def volcar_eventos() -> int:
+    """Escribe en la base todos los eventos encolados en una única transacción"""
+    with _auditoria_lock:
+        lote = list(_auditoria_buffer)
+        _auditoria_buffer.clear()
+    if not lote:
+        return 0
+    conn = None
+    try:
+        conn = sqlite3.connect(DATABASE)
+        conn.executemany(
+            'INSERT INTO eventos_auth (fecha, evento, usuario, ip, exito, detalle) VALUES (?, ?, ?, ?, ?, ?)',
+            lote
+        )
+        conn.commit()
+    except sqlite3.Error as exc:
+        log_error(f"No se pudieron guardar {len(lote)} eventos de auditoría: {exc}")
+        _reencolar_eventos(lote)
+        return 0
+    finally:
+        if conn is not None:
+            conn.close()
+    return len(lote)
+
+
+def _reencolar_eventos(lote: list) -> None:
+    """Devuelve un lote fallido al frente del buffer; lo que no entra cuenta como descartado"""
+    global _auditoria_descartados
+    with _auditoria_lock:
+        pendientes = lote + list(_auditoria_buffer)
+        sobrantes = max(0, len(pendientes) - _auditoria_buffer.maxlen)
+        _auditoria_descartados += sobrantes
+        _auditoria_buffer.clear()
+        _auditoria_buffer.extend(pendientes[sobrantes:])
+
+
+def _bucle_auditoria() -> None:
+    while not _auditoria_detener.is_set():
+        _auditoria_pendiente.wait(AUDITORIA_INTERVALO_FLUSH)
+        _auditoria_pendiente.clear()
+        try:
+            volcar_eventos()
+        except Exception as exc:  # pragma: no cover - el hilo no debe terminar
+            log_error(f"Error en el hilo de auditoría: {exc}")
+
+
+def iniciar_auditoria() -> threading.Thread:
+    """Inicia el hilo que vuelca periódicamente los eventos de auditoría"""
+    hilo = threading.Thread(target=_bucle_auditoria, name='auditoria-auth', daemon=True)
+    hilo.start()
+    atexit.register(detener_auditoria)
+    return hilo
+
+
+def detener_auditoria() -> None:
+    _auditoria_detener.set()
+    _auditoria_pendiente.set()
+    volcar_eventos()
+
+
+def fecha_valida(fecha: str) -> bool:
+    """Comprueba que la fecha tenga exactamente el formato 'AAAA-MM-DD HH:MM:SS'"""
+    try:
+        return time.strftime(FORMATO_FECHA, time.strptime(fecha, FORMATO_FECHA)) == fecha
+    except ValueError:
+        return False
+
+
+def consultar_eventos(usuario=None, desde=None, hasta=None, limite: int = 100) -> list:
+    """Consulta eventos por usuario y rango de fechas (formato 'AAAA-MM-DD HH:MM:SS', UTC)"""
+    condiciones = []
+    parametros = []
+    if usuario:
+        condiciones.append('usuario = ?')
+        parametros.append(usuario)
+    if desde:
+        condiciones.append('fecha >= ?')
+        parametros.append(desde)
+    if hasta:
+        condiciones.append('fecha <= ?')
+        parametros.append(hasta)
+    where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ''
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        f'SELECT fecha, evento, usuario, ip, exito, detalle FROM eventos_auth {where} '
+        'ORDER BY fecha DESC, id DESC LIMIT ?',
+        (*parametros, limite)
+    )
+    filas = cursor.fetchall()
+    conn.close()
+    return filas
+
+
+# =============================================================================
+# RESPALDO Y RESTAURACIÓN
+# =============================================================================
+
+def _mb_por_segundo(cantidad_bytes: int, segundos: float) -> float:
+    return (cantidad_bytes / (1024 * 1024)) / max(segundos, 1e-9)
+
+
+def rotar_backups(directorio: str, conservar: int) -> list:
+    """Elimina los respaldos más antiguos dejando solo los `conservar` más recientes"""
+    respaldos = sorted(
+        nombre for nombre in os.listdir(directorio)
+        if nombre.startswith('tareas-') and nombre.endswith('.db.gz')
+    )
+    eliminados = respaldos[:-conservar] if conservar > 0 else []
+    for nombre in eliminados:
+        os.remove(os.path.join(directorio, nombre))
+    return eliminados
+
+
+def crear_backup(directorio: str = BACKUP_DIRECTORIO, conservar: int = BACKUP_CONSERVAR) -> str:
+    """Respalda la base en caliente con la API de backup de SQLite y la comprime"""
+    os.makedirs(directorio, exist_ok=True)
+    ahora = time.time()
+    # UTC: la rotación ordena los nombres como texto y no debe verse afectada por el horario de verano
+    marca = f"{time.strftime('%Y%m%d-%H%M%S', time.gmtime(ahora))}-{int(ahora * 1000) % 1000:03d}"
+    temporal = os.path.join(directorio, f'.tareas-{marca}.db.tmp')
+    comprimido = os.path.join(directorio, f'.tareas-{marca}.db.gz.tmp')
+    destino = os.path.join(directorio, f'tareas-{marca}.db.gz')
+    if os.path.exists(destino):
+        raise FileExistsError(destino)
+
+    inicio = time.perf_counter()
+    try:
+        origen_conn = sqlite3.connect(DATABASE)
+        temporal_conn = sqlite3.connect(temporal)
+        try:
+            modo = origen_conn.execute('PRAGMA journal_mode').fetchone()[0]
+            if modo.lower() != 'wal':
+                modo = origen_conn.execute('PRAGMA journal_mode = WAL').fetchone()[0]
+                if modo.lower() == 'wal':
+                    log_warn("La base no estaba en modo WAL; se activó antes de respaldar")
+                else:
+                    log_warn(f"La base está en modo {modo}: la copia bloqueará a los escritores")
+            # Copia en un solo paso: en modo WAL solo mantiene una instantánea de
+            # lectura y no bloquea a los escritores. Una copia por pasos se reinicia
+            # cada vez que otra conexión escribe y podría no terminar nunca.
+            origen_conn.backup(temporal_conn, pages=-1)
+        finally:
+            temporal_conn.close()
+            origen_conn.close()
+        duracion_copia = time.perf_counter() - inicio
+
+        tamaño = os.path.getsize(temporal)
+        # Se comprime a un nombre oculto y se renombra solo si terminó bien, para que
+        # la rotación nunca cuente un respaldo truncado como válido
+        with open(temporal, 'rb') as entrada, gzip.open(comprimido, 'wb', compresslevel=6) as salida:
+            shutil.copyfileobj(entrada, salida, 1024 * 1024)
+        os.replace(comprimido, destino)
+    finally:
+        for archivo in (temporal, comprimido):
+            if os.path.exists(archivo):
+                os.remove(archivo)
+    duracion_total = time.perf_counter() - inicio
+
+    log_ok(f"Respaldo creado: {destino}")
+    log_bullet(
+        f"{tamaño / (1024 * 1024):.2f} MB -> {os.path.getsize(destino) / (1024 * 1024):.2f} MB comprimido"
+    )
+    log_bullet(
+        f"Copia {_mb_por_segundo(tamaño, duracion_copia):.1f} MB/s, "
+        f"total {_mb_por_segundo(tamaño, duracion_total):.1f} MB/s ({duracion_total:.2f} s)"
+    )
+    for nombre in rotar_backups(directorio, conservar):
+        log_info(f"Respaldo antiguo eliminado: {nombre}")
+    return destino
+
+
+def restaurar_backup(archivo: str) -> None:
+    """Restaura un respaldo comprimido sobre la base de datos actual"""
+    if not os.path.isfile(archivo):
+        raise FileNotFoundError(archivo)
+    temporal = f'{DATABASE}.restaurar.tmp'
+
+    inicio = time.perf_counter()
+    try:
+        with gzip.open(archivo, 'rb') as entrada, open(temporal, 'wb') as salida:
+            shutil.copyfileobj(entrada, salida, 1024 * 1024)
+        tamaño = os.path.getsize(temporal)
+
+        respaldo_conn = sqlite3.connect(temporal)
+        try:
+            # Se valida el respaldo antes de tocar la base en uso
+            resultado = respaldo_conn.execute('PRAGMA quick_check').fetchone()[0]
+            if resultado != 'ok':
+                raise sqlite3.DatabaseError(f'Respaldo dañado: {resultado}')
+            destino_conn = sqlite3.connect(DATABASE)
+            try:
+                # Restauración en un solo paso: se prioriza la velocidad sobre la concurrencia
+                respaldo_conn.backup(destino_conn, pages=-1)
+            finally:
+                destino_conn.close()
+        finally:
+            respaldo_conn.close()
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    duracion = time.perf_counter() - inicio
+
+    log_ok(f"Base de datos restaurada desde {archivo}")
+    log_bullet(f"{tamaño / (1024 * 1024):.2f} MB a {_mb_por_segundo(tamaño, duracion):.1f} MB/s ({duracion:.2f} s)")
+
+
 # =============================================================================
 # PUNTO DE ENTRADA PRINCIPAL
 # =============================================================================
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Servidor Flask del sistema de tareas')
+    acciones = parser.add_mutually_exclusive_group()
+    acciones.add_argument(
+        '--backup', nargs='?', const=BACKUP_DIRECTORIO, metavar='DIRECTORIO',
+        help=f'Crea un respaldo comprimido en caliente (por defecto en {BACKUP_DIRECTORIO}/) y termina'
+    )
+    acciones.add_argument(
+        '--restaurar', metavar='ARCHIVO',
+        help='Restaura la base de datos desde un respaldo .db.gz y termina'
+    )
+    parser.add_argument(
+        '--conservar', type=int, default=BACKUP_CONSERVAR,
+        help=f'Cantidad de respaldos a conservar al rotar (por defecto {BACKUP_CONSERVAR})'
+    )
+    return parser.parse_args()
+
+
 if __name__ == '__main__':
+    args = parse_args()
+    if args.backup:
+        log_title("Respaldando base de datos...")
+        try:
+            crear_backup(args.backup, args.conservar)
+        except (OSError, sqlite3.DatabaseError) as exc:
+            log_error(f"No se pudo crear el respaldo: {exc}")
+            raise SystemExit(1)
+        raise SystemExit(0)
+    if args.restaurar:
+        log_title("Restaurando base de datos...")
+        try:
+            restaurar_backup(args.restaurar)
+        except FileNotFoundError:
+            log_error(f"No existe el respaldo {args.restaurar}")
+            raise SystemExit(1)
+        except (OSError, EOFError, sqlite3.DatabaseError) as exc:
+            # EOFError: archivo gzip truncado
+            log_error(f"Respaldo inválido {args.restaurar}: {exc}")
+            raise SystemExit(1)
+        raise SystemExit(0)
+
     init_db()
     log_title("Iniciando servidor Flask...")
     log_info("Endpoints disponibles:")
@@ -230,6 +858,7 @@ if __name__ == '__main__':
     log_bullet("POST /registro - Registrar usuario")
     log_bullet("POST /login - Validar credenciales")
     log_bullet("GET /tareas - Información de tareas (requiere Basic Auth)")
+    log_bullet("GET /eventos - Auditoría de autenticación (requiere Basic Auth)")
     log_bullet("POST /logout - Mensaje informativo")
     log_ok("Base de datos SQLite inicializada")
     app.run(debug=True, host='0.0.0.0', port=5555)
\ No newline at end of file